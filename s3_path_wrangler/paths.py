@@ -1,12 +1,18 @@
 import logging
 import re
-from typing import Iterable, List, Optional, Union
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 LOGGER = logging.getLogger(__name__)
 
-DNS_NAME_REGEX = r"(?![0-9]+$)(?!-)[a-zA-Z0-9-]{,63}(?<!-)"
+# Not anchored, so that it can be embedded into other patterns (such as S3_PATH_REGEX)
+DNS_NAME_REGEX = r"(?![0-9]+(?![a-zA-Z0-9-]))(?!-)[a-zA-Z0-9-]{1,63}(?<!-)"
 S3_PATH_REGEX = r"^s3:\/\/(" + DNS_NAME_REGEX + r")\/(.+)$"
 
+_S3_PREFIX = "s3://"
+_S3_PREFIX_LEN = len(_S3_PREFIX)
+_DNS_NAME_RE = re.compile(DNS_NAME_REGEX)
+
 
 class InvalidPathError(ValueError):
     pass
@@ -21,7 +27,9 @@ class InvalidBucketError(ValueError):
 
 
 class S3Path:
-    _PREFIX = "s3://"
+    __slots__ = ("_parts", "_is_absolute", "_str", "_hash", "__weakref__")
+
+    _PREFIX = _S3_PREFIX
 
     def __init__(self, path: str):
         """Parses a string representation of an S3 path.
@@ -39,21 +47,69 @@ class S3Path:
             InvalidBucketError: When the bucket of the absolute path does not have a valid name.
                 https://docs.aws.amazon.com/AmazonS3/latest/dev/BucketRestrictions.html#bucketnamingrules
         """
+        self._parts, self._is_absolute = S3Path._parse(path)
+        self._str = None
+        self._hash = None
+
+    @classmethod
+    def from_strings(cls, paths: Iterable[str]) -> List["S3Path"]:
+        """Parses many string representations of S3 paths at once.
+
+        Behaves the same as calling the constructor for each string, but every distinct bucket name is only
+        validated once, which makes it faster for large listings of keys from the same buckets.
+
+        Args:
+            paths: String representations of relative or absolute S3 paths.
+
+        Raises:
+            InvalidPathError: When some passed string is not a valid S3 path.
+            InvalidBucketError: When the bucket of some absolute path does not have a valid name.
+
+        Returns:
+            S3 path representations in the same order as the passed strings.
+        """
+        known_buckets = {}
+        return [
+            S3Path._from_validated(*S3Path._parse(path, known_buckets))
+            for path in paths
+        ]
+
+    @classmethod
+    def _parse(
+        cls, path: str, known_buckets: Optional[Dict[str, str]] = None
+    ) -> Tuple[Tuple[str, ...], bool]:
+        """Parses and validates a string representation of an S3 path.
+
+        Args:
+            path: String representation of a relative or absolute S3 path.
+            known_buckets: Bucket names which were already validated, mapped to their interned versions.
+                New valid bucket names are added to it.
+
+        Raises:
+            InvalidPathError: When the passed string is not a valid S3 path.
+            InvalidBucketError: When the bucket of the absolute path does not have a valid name.
+
+        Returns:
+            The parts of the path and whether it is absolute.
+        """
         if path.startswith("/"):
             raise InvalidPathError(
                 f"Path ({path}) cannot start with a slash. "
                 f"If an absolute path is required, use the S3 prefix - 's3://bucket/...'"
             )
-        if path.startswith(self._PREFIX):
-            self._is_absolute = True
-            path = path.lstrip(self._PREFIX)
-        else:
-            self._is_absolute = False
-        parts = path.strip("/").split("/")
-        S3Path._validate_parts(parts)
-        if self._is_absolute:
-            S3Path._validate_bucket(parts[0])
-        self._parts = parts
+        if not path.startswith(_S3_PREFIX):
+            return S3Path._split_and_validate(path), False
+
+        parts = S3Path._split_and_validate(path[_S3_PREFIX_LEN:])
+        bucket = parts[0]
+        interned_bucket = known_buckets.get(bucket) if known_buckets else None
+        if interned_bucket is None:
+            S3Path._validate_bucket(bucket)
+            # Many paths usually share a few buckets, interning lets them share a single string object
+            interned_bucket = sys.intern(bucket)
+            if known_buckets is not None:
+                known_buckets[bucket] = interned_bucket
+        return (interned_bucket,) + parts[1:], True
 
     @classmethod
     def from_parts(cls, parts: Iterable[str], is_absolute: bool = False) -> "S3Path":
@@ -66,49 +122,81 @@ class S3Path:
         Returns:
             An S3 path representation similar to `pathlib.Path`.
         """
-        part_list = list(parts)
-        S3Path._validate_parts(part_list)
-        path = ""
+        # tuple() returns tuples as they are, other collections need to be copied to keep the path immutable
+        part_tuple = tuple(parts)
+        S3Path._validate_parts(part_tuple)
         if is_absolute:
-            S3Path._validate_bucket(part_list[0])
-            path = S3Path._PREFIX
-        path = path + "/".join(part_list)
-        return S3Path(path)
+            S3Path._validate_bucket(part_tuple[0])
+        return S3Path._from_validated(part_tuple, is_absolute)
 
     @classmethod
-    def from_bucket(cls, bucket_name: str) -> "S3Path":
-        """Constructs an S3 path pointing to a bucket.
+    def _from_validated(cls, parts: Tuple[str, ...], is_absolute: bool) -> "S3Path":
+        """Constructs an S3 path from parts which are already known to be valid.
+
+        Skips parsing and validation, so it should only be used internally.
 
         Args:
-            bucket_name: Name of the bucket. Should not include the 's3://' prefix - use constructor
-                for that instead.
+            parts: Validated path parts.
+            is_absolute: Whether the first part is the S3 bucket.
 
         Returns:
             An S3 path representation similar to `pathlib.Path`.
         """
-        return S3Path.from_parts([bucket_name], is_absolute=True)
+        path = object.__new__(cls)
+        path._parts = parts
+        path._is_absolute = is_absolute
+        path._str = None
+        path._hash = None
+        return path
 
     @classmethod
-    def _is_valid_part(cls, part: str) -> bool:
-        """Checks if a single part of a path is valid.
+    def from_bucket(cls, bucket_name: str) -> "S3Path":
+        """Constructs an S3 path pointing to a bucket.
 
         Args:
-            part: Path part to check.
+            bucket_name: Name of the bucket. Should not include the 's3://' prefix - use constructor
+                for that instead.
 
         Returns:
-            True if the part is valid, False otherwise.
+            An S3 path representation similar to `pathlib.Path`.
         """
-        return bool(part) and not part.isspace() and "/" not in part
+        return S3Path.from_parts((bucket_name,), is_absolute=True)
 
     @classmethod
     def _validate_parts(cls, parts: Iterable[str]) -> None:
         """Raises an exception if there are invalid parts.
 
+        A part is invalid if it is empty, only contains whitespace or contains a slash.
+
         Args:
             parts: A collection of parts to check.
         """
-        if not parts or any(not S3Path._is_valid_part(part) for part in parts):
-            raise InvalidPathError(f"Some S3 path parts from {parts} are not valid")
+        if not parts:
+            raise InvalidPathError("Some S3 path parts are not valid", parts)
+        for part in parts:
+            # strip() removes the same characters isspace() checks for, so this also rejects empty parts
+            if "/" in part or not part.strip():
+                raise InvalidPathError("Some S3 path parts are not valid", parts)
+
+    @classmethod
+    def _split_and_validate(cls, path: str) -> Tuple[str, ...]:
+        """Splits a slash-separated path (without the S3 prefix) into parts and validates them.
+
+        Args:
+            path: Path to split. Leading and trailing slashes are ignored.
+
+        Raises:
+            InvalidPathError: When some of the parts are not valid.
+
+        Returns:
+            The validated parts of the path.
+        """
+        parts = tuple(path.strip("/").split("/"))
+        # Split parts cannot contain slashes, so only empty and whitespace-only ones need to be rejected.
+        # map() and all() run this loop in C rather than via a generator.
+        if not all(map(str.strip, parts)):
+            raise InvalidPathError("Some S3 path parts are not valid", parts)
+        return parts
 
     @classmethod
     def _validate_bucket(cls, bucket: str) -> None:
@@ -120,7 +208,7 @@ class S3Path:
         See Also:
             https://docs.aws.amazon.com/AmazonS3/latest/dev/BucketRestrictions.html#bucketnamingrules
         """
-        if not re.fullmatch(DNS_NAME_REGEX, bucket):
+        if not _DNS_NAME_RE.fullmatch(bucket):
             raise InvalidBucketError(f"{bucket} is not a valid bucket name")
 
     @property
@@ -128,9 +216,9 @@ class S3Path:
         """The parsed parts of the path.
 
         Returns:
-            A list of path segments.
+            A new list of path segments (changing it does not affect the path).
         """
-        return self._parts
+        return list(self._parts)
 
     @property
     def is_absolute(self) -> bool:
@@ -149,9 +237,10 @@ class S3Path:
         Returns:
             An S3Path instance which is absolute.
         """
-        if self.is_absolute:
+        if self._is_absolute:
             return self
-        return S3Path.from_parts(self.parts, is_absolute=True)
+        S3Path._validate_bucket(self._parts[0])
+        return S3Path._from_validated(self._parts, is_absolute=True)
 
     def with_bucket(self, bucket: str) -> "S3Path":
         """Changes the bucket of the path.
@@ -168,13 +257,13 @@ class S3Path:
         """
         stripped_bucket = bucket.strip("/")
         S3Path._validate_bucket(stripped_bucket)
+        stripped_bucket = sys.intern(stripped_bucket)
 
-        new_parts = self.parts.copy()
-        if self.is_absolute:
-            new_parts[0] = bucket
+        if self._is_absolute:
+            new_parts = (stripped_bucket,) + self._parts[1:]
         else:
-            new_parts.insert(0, stripped_bucket)
-        return S3Path.from_parts(new_parts, is_absolute=True)
+            new_parts = (stripped_bucket,) + self._parts
+        return S3Path._from_validated(new_parts, is_absolute=True)
 
     @property
     def bucket(self) -> str:
@@ -186,9 +275,9 @@ class S3Path:
         Returns:
             The name of the bucket the path resides in.
         """
-        if not self.is_absolute:
+        if not self._is_absolute:
             raise UnknownBucketError("Cannot compute the bucket of a relative path")
-        return self.parts[0]
+        return self._parts[0]
 
     @property
     def key(self) -> str:
@@ -201,8 +290,8 @@ class S3Path:
         Returns:
             The key of the S3 folder or file this path is referring to.
         """
-        if self.is_absolute:
-            return "/".join(self.parts[1:])
+        if self._is_absolute:
+            return "/".join(self._parts[1:])
         raise UnknownBucketError(
             "Cannot compute the key, bucket of a relative path is not defined"
         )
@@ -214,7 +303,7 @@ class S3Path:
         Returns:
             The name (final segment) of the folder or file this path is referring to.
         """
-        return self.parts[-1]
+        return self._parts[-1]
 
     @property
     def parent(self) -> Optional["S3Path"]:
@@ -224,9 +313,9 @@ class S3Path:
             The path to the bucket if this path is directly within the bucket, the path of the parent folder if this
                 path is deeper inside a bucket, or None if this path is referring to a bucket.
         """
-        if len(self.parts) == 1:
+        if len(self._parts) == 1:
             return None
-        return S3Path.from_parts(self.parts[:-1], self.is_absolute)
+        return S3Path._from_validated(self._parts[:-1], self._is_absolute)
 
     def __truediv__(self, other: Union[str, "S3Path"]):
         """Appends a path or path segment to this path.
@@ -238,27 +327,31 @@ class S3Path:
             A new S3Path instance referring to the combined location.
         """
         if isinstance(other, str):
-            path_str = other.lstrip("/")
-            other_path = S3Path(path_str)
+            if other.lstrip("/").startswith(_S3_PREFIX):
+                raise ValueError(f"Cannot add an absolute path {other} to another path")
+            other_parts = S3Path._split_and_validate(other)
         elif other.is_absolute:
             raise ValueError(f"Cannot add an absolute path {other} to another path")
         else:
-            other_path = other
-        combined_parts = self.parts + other_path.parts
-        return S3Path.from_parts(combined_parts, self.is_absolute)
+            other_parts = other._parts
+        return S3Path._from_validated(self._parts + other_parts, self._is_absolute)
 
     def __repr__(self) -> str:
         """Calculates the path's string representation.
 
         This will never create trailing slashes, which can be useful when comparing to strings.
+        The representation is computed once and cached, since paths are immutable.
 
         Returns:
             String representation of the path.
         """
-        relative_representation = "/".join(self.parts)
-        if self.is_absolute:
-            return self._PREFIX + relative_representation
-        return relative_representation
+        representation = self._str
+        if representation is None:
+            representation = "/".join(self._parts)
+            if self._is_absolute:
+                representation = _S3_PREFIX + representation
+            self._str = representation
+        return representation
 
     def __eq__(self, other: Union[str, "S3Path"]) -> bool:
         """Checks if this is the same path as another one.
@@ -269,8 +362,39 @@ class S3Path:
         Returns:
             True if both paths refer to the same location, False otherwise.
         """
-        other_path = S3Path(other) if isinstance(other, str) else other
-        return (
-            self.parts == other_path.parts
-            and self.is_absolute == other_path.is_absolute
-        )
+        if self is other:
+            return True
+        if isinstance(other, str):
+            # Strings without trailing slashes can be compared to the cached representation without parsing
+            if other == repr(self):
+                return True
+            other = S3Path(other)
+        elif not isinstance(other, S3Path):
+            return NotImplemented
+        return self._is_absolute == other._is_absolute and self._parts == other._parts
+
+    def __hash__(self) -> int:
+        """Calculates the hash of the path, so that paths can be used in sets and as dictionary keys.
+
+        The hash is the same as the hash of the string representation, so strings without trailing slashes
+        can be used to look up paths in sets and dictionaries. Strings with trailing slashes are still equal
+        to the path, but will not match its hash.
+
+        Returns:
+            Hash of the path, computed once and cached.
+        """
+        path_hash = self._hash
+        if path_hash is None:
+            path_hash = hash(repr(self))
+            self._hash = path_hash
+        return path_hash
+
+    def __reduce__(self):
+        """Pickles the path as its string representation.
+
+        The cached hash is not pickled, since string hashes differ between processes.
+
+        Returns:
+            The class and the arguments to reconstruct the path with.
+        """
+        return self.__class__, (repr(self),)
@@ -1,6 +1,12 @@
+import pickle
+import re
+import weakref
+
 import pytest
 
 from s3_path_wrangler.paths import (
+    DNS_NAME_REGEX,
+    S3_PATH_REGEX,
     InvalidBucketError,
     InvalidPathError,
     S3Path,
@@ -60,6 +66,12 @@ def test_when_s3_path_is_constructed_from_parts_then_the_resulting_parts_are_the
     assert S3Path.from_parts(input_parts).parts == expected_parts
 
 
+def test_when_parts_of_a_path_are_modified_then_the_path_does_not_change():
+    path = S3Path("folder/file.txt")
+    path.parts.append("other.txt")
+    assert path == "folder/file.txt"
+
+
 def test_when_s3_path_is_constructed_from_bucket_then_it_only_has_one_part():
     assert S3Path.from_bucket("bucket").parts == ["bucket"]
 
@@ -83,9 +95,34 @@ def test_when_s3_path_is_constructed_with_invalid_parts_then_validation_error_is
         S3Path.from_parts(input_parts)
 
 
-def test_when_s3_path_is_constructed_from_invalid_bucket_then_validation_error_is_raised():
+@pytest.mark.parametrize(
+    "bucket",
+    [
+        pytest.param("bucket^with_invalid*name", id="invalid_characters"),
+        pytest.param("-bucket", id="leading_dash"),
+        pytest.param("bucket-", id="trailing_dash"),
+        pytest.param("12345", id="only_digits"),
+        pytest.param("b" * 64, id="too_long"),
+        pytest.param("bučket", id="non_ascii"),
+    ],
+)
+def test_when_s3_path_is_constructed_from_invalid_bucket_then_validation_error_is_raised(
+    bucket,
+):
     with pytest.raises(InvalidBucketError):
-        S3Path.from_bucket("bucket^with_invalid*name")
+        S3Path.from_bucket(bucket)
+
+
+@pytest.mark.parametrize(
+    "bucket",
+    [
+        pytest.param("b", id="single_character"),
+        pytest.param("b" * 63, id="longest"),
+        pytest.param("my-Bucket-2", id="mixed_characters"),
+    ],
+)
+def test_when_s3_path_is_constructed_from_valid_bucket_then_it_is_accepted(bucket):
+    assert S3Path.from_bucket(bucket).bucket == bucket
 
 
 @pytest.mark.parametrize(
@@ -109,6 +146,11 @@ def test_when_s3_path_is_constructed_from_invalid_bucket_then_validation_error_i
             ["bucket", "folder", "file.txt"],
             id="bucket_with_folder_with_file",
         ),
+        pytest.param(
+            "s3://s3-bucket/file.txt",
+            ["s3-bucket", "file.txt"],
+            id="bucket_starting_with_prefix_characters",
+        ),
         pytest.param("folder", ["folder"], id="relative_folder"),
         pytest.param("folder/", ["folder"], id="relative_folder_with_trailing_slash"),
         pytest.param(
@@ -139,6 +181,56 @@ def test_when_s3_path_is_created_from_invalid_path_then_validation_error_is_rais
         S3Path(input_str)
 
 
+def test_when_s3_paths_are_created_from_strings_then_they_match_individually_created_paths():
+    paths = [
+        "s3://bucket/folder/file.txt",
+        "folder/file.txt",
+        "s3://bucket/other/",
+        "s3://other-bucket",
+    ]
+    assert S3Path.from_strings(paths) == [S3Path(path) for path in paths]
+
+
+@pytest.mark.parametrize(
+    "input_str,expected_error",
+    [
+        pytest.param(
+            "s3://bucket^with_invalid*name/folder/file.txt",
+            InvalidBucketError,
+            id="invalid_bucket",
+        ),
+        pytest.param(
+            "/folder/file.txt",
+            InvalidPathError,
+            id="relative_path_but_prefixed_with_slash",
+        ),
+        pytest.param(
+            "s3://bucket/ /file.txt", InvalidPathError, id="folder_name_is_empty"
+        ),
+    ],
+)
+def test_when_s3_paths_are_created_from_strings_with_an_invalid_path_then_validation_error_is_raised(
+    input_str, expected_error
+):
+    with pytest.raises(expected_error):
+        S3Path.from_strings(["s3://bucket/file.txt", input_str])
+
+
+def test_when_the_same_invalid_bucket_is_parsed_twice_then_it_is_rejected_both_times():
+    known_buckets = {}
+    for _ in range(2):
+        with pytest.raises(InvalidBucketError):
+            S3Path._parse("s3://bucket^with_invalid*name/file.txt", known_buckets)
+    assert known_buckets == {}
+    with pytest.raises(InvalidBucketError):
+        S3Path.from_strings(
+            [
+                "s3://bucket^with_invalid*name/file.txt",
+                "s3://bucket^with_invalid*name/other.txt",
+            ]
+        )
+
+
 def test_when_s3_path_is_constructed_from_parts_then_it_is_relative():
     assert not RELATIVE_PATH.is_absolute
 
@@ -175,6 +267,13 @@ def test_when_a_valid_bucket_is_added_to_an_absolute_path_then_it_replaces_then_
     )
 
 
+def test_when_a_bucket_with_slashes_is_added_to_an_absolute_path_then_slashes_are_stripped():
+    assert (
+        ABSOLUTE_PATH.with_bucket("/new-bucket/")
+        == "s3://new-bucket/" + ABSOLUTE_PATH.key
+    )
+
+
 def test_when_an_invalid_bucket_is_added_to_a_path_then_error_is_raised():
     with pytest.raises(InvalidBucketError):
         RELATIVE_PATH.with_bucket("not$a%valid&bucket*name!")
@@ -189,6 +288,17 @@ def test_when_s3_path_is_absolute_then_bucket_can_be_retrieved():
     assert ABSOLUTE_PATH.bucket == "bucket"
 
 
+def test_when_absolute_paths_share_a_bucket_then_the_bucket_name_is_the_same_object():
+    assert S3Path("s3://bucket/a").bucket is S3Path("s3://bucket/b").bucket
+
+
+def test_when_paths_get_the_same_bucket_then_the_bucket_name_is_the_same_object():
+    assert (
+        RELATIVE_PATH.with_bucket("/bucket/").bucket
+        is ABSOLUTE_PATH.with_bucket("bucket/").bucket
+    )
+
+
 def test_when_path_is_relative_then_retrieving_key_raises_error():
     with pytest.raises(UnknownBucketError):
         _ = RELATIVE_PATH.key
@@ -325,3 +435,81 @@ def test_adding_extra_paths(starting_path, path_to_add, expected_path):
 def test_when_adding_an_absolute_path_to_another_path_then_error_is_raised():
     with pytest.raises(ValueError):
         ABSOLUTE_PATH / ABSOLUTE_PATH
+
+
+@pytest.mark.parametrize(
+    "path_to_add",
+    [
+        pytest.param("s3://other-bucket/file.txt", id="absolute_path"),
+        pytest.param("///s3://", id="prefix_with_leading_slashes"),
+    ],
+)
+def test_when_adding_an_absolute_str_path_to_another_path_then_error_is_raised(
+    path_to_add,
+):
+    with pytest.raises(ValueError, match="Cannot add an absolute path"):
+        RELATIVE_PATH / path_to_add
+
+
+def test_when_paths_are_equal_then_their_hashes_are_equal():
+    assert hash(S3Path("s3://bucket/folder/")) == hash(
+        S3Path.from_parts(["bucket", "folder"], is_absolute=True)
+    )
+
+
+def test_when_equal_paths_are_added_to_a_set_then_they_are_deduplicated():
+    paths = {S3Path("folder/file.txt"), S3Path("folder/file.txt/"), S3Path("file.txt")}
+    assert len(paths) == 2
+
+
+def test_when_path_is_in_a_set_then_it_can_be_found_by_its_string_representation():
+    assert "s3://bucket/folder/file.txt" in {S3Path("s3://bucket/folder/file.txt")}
+
+
+def test_when_path_is_a_dictionary_key_then_it_can_be_found_by_its_string_representation():
+    assert {S3Path("folder/file.txt/"): 1}.get("folder/file.txt") == 1
+
+
+def test_when_path_is_compared_to_an_unrelated_object_then_it_is_not_equal():
+    assert RELATIVE_PATH != 42
+
+
+@pytest.mark.parametrize(
+    "bucket,is_valid",
+    [
+        pytest.param("bucket", True, id="valid"),
+        pytest.param("", False, id="empty"),
+        pytest.param("12345", False, id="only_digits"),
+        pytest.param("-bucket", False, id="leading_dash"),
+        pytest.param("b" * 64, False, id="too_long"),
+    ],
+)
+def test_dns_name_regex_matches_the_same_buckets_as_bucket_validation(bucket, is_valid):
+    assert bool(re.fullmatch(DNS_NAME_REGEX, bucket)) == is_valid
+    assert bool(re.match(S3_PATH_REGEX, f"s3://{bucket}/key")) == is_valid
+    if is_valid:
+        S3Path._validate_bucket(bucket)
+    else:
+        with pytest.raises(InvalidBucketError):
+            S3Path._validate_bucket(bucket)
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param(ABSOLUTE_PATH, id="absolute"),
+        pytest.param(RELATIVE_PATH, id="relative"),
+    ],
+)
+def test_when_path_is_pickled_then_it_can_still_be_found_in_a_set(path, protocol):
+    hash(path)
+    unpickled_path = pickle.loads(pickle.dumps(path, protocol=protocol))
+    assert unpickled_path == path
+    assert unpickled_path._hash is None
+    assert unpickled_path in {path}
+    assert str(path) in {unpickled_path}
+
+
+def test_when_weak_reference_to_path_is_created_then_it_refers_to_the_path():
+    assert weakref.ref(ABSOLUTE_PATH)() is ABSOLUTE_PATH